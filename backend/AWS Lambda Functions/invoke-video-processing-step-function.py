@@ -3,6 +3,7 @@ import boto3
 import os
 from datetime import datetime
 import re
+import string
 
 from urllib.parse import unquote_plus
 
@@ -12,6 +13,19 @@ sfn_client = boto3.client('stepfunctions')
 # Get state machine ARN from environment variable
 STATE_MACHINE_ARN = os.environ['STATE_MACHINE_ARN']
 
+# Compiled once per container instead of per S3 event
+_CAT_SPLIT = re.compile(r'[|,]')
+
+
+class _ExecutionNameTable(dict):
+    """str.translate table keeping [a-zA-Z0-9_-] and mapping every other character to '-'"""
+    def __missing__(self, code):
+        self[code] = '-'
+        return '-'
+
+
+_NAME_TABLE = _ExecutionNameTable({ord(c): c for c in string.ascii_letters + string.digits + '_-'})
+
 ############ Updated for new input
 def parse_categories_from_key(key: str) -> list:
     """Parse categories from S3 key. Key format: {categories}/{filename} or {filename}"""
@@ -22,7 +36,7 @@ def parse_categories_from_key(key: str) -> list:
     if not prefix:
         return ['Uncategorized']
     # Support both comma and pipe delimiters for backward compatibility
-    categories = [c.strip() for c in re.split(r'[|,]', prefix) if c.strip()]
+    categories = [c.strip() for c in _CAT_SPLIT.split(prefix) if c.strip()]
     return categories if categories else ['Uncategorized']
 
 def lambda_handler(event, context):
@@ -62,7 +76,7 @@ def lambda_handler(event, context):
         try:
             response = sfn_client.start_execution(
                 stateMachineArn=STATE_MACHINE_ARN,
-                name=f"video-process-{re.sub(r'[^a-zA-Z0-9_-]', '-', key)[:28]}-{timestamp}",
+                name=f"video-process-{key[:28].translate(_NAME_TABLE)}-{timestamp}",
                 input=json.dumps(sfn_input)
             )
             
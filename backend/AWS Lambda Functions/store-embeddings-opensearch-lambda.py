@@ -2,14 +2,26 @@ import json
 import boto3
 import os
 import hashlib
-from opensearchpy import OpenSearch, RequestsHttpConnection, AWSV4SignerAuth
+import base64
+import math
+from array import array
+from botocore.config import Config
+from boto3.s3.transfer import TransferConfig
+from opensearchpy import OpenSearch, RequestsHttpConnection, AWSV4SignerAuth, helpers
+from opensearchpy.exceptions import SerializationError
+from opensearchpy.serializer import JSONSerializer
 from typing import Dict, List, Optional
 import uuid
-from collections import defaultdict
 from datetime import datetime
 import subprocess
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Not bundled in every dependency layer; fall back to stdlib json
+    orjson = None
 
 # Configuration from environment variables
 THUMBNAIL_BUCKET = os.environ.get('THUMBNAIL_BUCKET')
@@ -18,6 +30,74 @@ EMBEDDING_DIMENSIONS = 512
 INDEX_NAME = 'video_clips_3_lucene'
 AWS_REGION = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
 
+# Bulk indexing limits: ~20 KB per doc (3 x 512-dim vectors as JSON) keeps 500 docs well under 50 MB
+BULK_CHUNK_SIZE = 500
+BULK_MAX_CHUNK_BYTES = 50 * 1024 * 1024
+# Lambda allocates CPU in proportion to memory (1 vCPU per ~1769 MB) but os.cpu_count() reports the
+# host's cores (2 even at 512 MB), so derive the share from the configured memory size when set
+LAMBDA_MB_PER_VCPU = 1769
+_lambda_memory_mb = os.environ.get('AWS_LAMBDA_FUNCTION_MEMORY_SIZE')
+ALLOCATED_VCPUS = (
+    max(1, min(int(_lambda_memory_mb) // LAMBDA_MB_PER_VCPU, os.cpu_count() or 1))
+    if _lambda_memory_mb else (os.cpu_count() or 2)
+)
+
+# Bulk worker threads, capped to the vCPUs Lambda allocates
+BULK_THREAD_COUNT = min(ALLOCATED_VCPUS, 4)
+
+# Static ffmpeg from the video-processing layer (/opt/bin), resolved once rather than via PATH on every spawn
+FFMPEG_PATH = os.environ.get('FFMPEG_PATH') or shutil.which('ffmpeg') or 'ffmpeg'
+
+# Concurrent ffmpeg runs for thumbnails; each seeks with -ss before -i, so runs are independent
+FRAME_EXTRACT_WORKERS = min(ALLOCATED_VCPUS, 4)
+# How far back to retry when a timestamp yields no frame (e.g. past the last frame)
+FRAME_FALLBACK_SEEK_BACK_SEC = 1.0
+
+# Concurrent S3 PUTs for thumbnails (boto3 clients are thread-safe)
+THUMBNAIL_UPLOAD_WORKERS = 16
+
+# S3 client reused across warm invocations, pooled for concurrent thumbnail uploads
+_s3_client = boto3.client(
+    's3',
+    region_name=AWS_REGION,
+    config=Config(
+        max_pool_connections=50,
+        retries={'max_attempts': 3, 'mode': 'adaptive'}
+    )
+)
+
+# Multipart download of the source video: 16 MB parts fetched over 20 concurrent connections
+VIDEO_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=20,
+    use_threads=True
+)
+
+# OpenSearch client and index check are cached per container (see get_opensearch_client)
+_opensearch_client: Optional[OpenSearch] = None
+_index_ensured = False
+
+
+class ORJSONSerializer(JSONSerializer):
+    """OpenSearch serializer backed by orjson, much faster for embedding-heavy documents"""
+    
+    def dumps(self, data):
+        # don't serialize strings (pre-built bulk bodies)
+        if isinstance(data, str):
+            return data
+        try:
+            return orjson.dumps(data, default=self.default).decode('utf-8')
+        except TypeError as e:
+            raise SerializationError(data, e)
+    
+    def loads(self, s):
+        try:
+            return orjson.loads(s)
+        except ValueError as e:
+            raise SerializationError(s, e)
+
+
 def lambda_handler(event, context):
     """
     Read embeddings from S3 and index into OpenSearch Cluster
@@ -40,7 +120,7 @@ def lambda_handler(event, context):
         print(f"Thumbnail bucket: {THUMBNAIL_BUCKET}")
         
         # Initialize clients with dynamic region
-        s3_client = boto3.client('s3', region_name=AWS_REGION)
+        s3_client = _s3_client
         opensearch_client = get_opensearch_client()
         
         # Parse S3 path
@@ -83,32 +163,36 @@ def lambda_handler(event, context):
 
 
 def get_opensearch_client():
-    """Initialize OpenSearch Cluster client with AWS authentication"""
-    opensearch_host = os.environ['OPENSEARCH_CLUSTER_HOST']
-    opensearch_host = opensearch_host.replace('https://', '').replace('http://', '').strip()
-    
-    session = boto3.Session()
-    credentials = session.get_credentials()
+    """Initialize OpenSearch Cluster client with AWS authentication, reused on warm invocations"""
+    global _opensearch_client
     
-    # Use dynamic region from environment
-    auth = AWSV4SignerAuth(credentials, AWS_REGION, 'es')
-    
-    client = OpenSearch(
-        hosts=[{'host': opensearch_host, 'port': 443}],
-        http_auth=auth,
-        use_ssl=True,
-        verify_certs=True,
-        connection_class=RequestsHttpConnection,
-        pool_maxsize=20,
-        timeout=30,
-        retry_on_timeout=True,
-        max_retries=3
-    )
+    if _opensearch_client is None:
+        opensearch_host = os.environ['OPENSEARCH_CLUSTER_HOST']
+        opensearch_host = opensearch_host.replace('https://', '').replace('http://', '').strip()
+        
+        session = boto3.Session()
+        credentials = session.get_credentials()
+        
+        # Use dynamic region from environment
+        auth = AWSV4SignerAuth(credentials, AWS_REGION, 'es')
+        
+        _opensearch_client = OpenSearch(
+            hosts=[{'host': opensearch_host, 'port': 443}],
+            http_auth=auth,
+            use_ssl=True,
+            verify_certs=True,
+            connection_class=RequestsHttpConnection,
+            pool_maxsize=20,
+            serializer=ORJSONSerializer() if orjson else JSONSerializer(),
+            timeout=30,
+            retry_on_timeout=True,
+            max_retries=3
+        )
     
-    # Ensure index exists (only on first call)
-    create_index_if_not_exists(client)
+    # Ensure index exists (no-op after the first success in this container)
+    create_index_if_not_exists(_opensearch_client)
     
-    return client
+    return _opensearch_client
 
 
 def create_index_if_not_exists(client):
@@ -116,11 +200,17 @@ def create_index_if_not_exists(client):
     Create production-grade consolidated video_clips index
     Optimized for accuracy, storage efficiency, and multimodal search
     """
+    global _index_ensured
+    
+    if _index_ensured:
+        return
+    
     index_name = INDEX_NAME
     
     try:
         if client.indices.exists(index=index_name):
             print(f"✓ Index {index_name} already exists")
+            _index_ensured = True
             return
         
         index_body = {
@@ -199,6 +289,7 @@ def create_index_if_not_exists(client):
         
         client.indices.create(index=index_name, body=index_body)
         print(f"✓ Created production-grade consolidated index: {index_name}")
+        _index_ensured = True
         
     except Exception as e:
         print(f"Error creating index: {e}")
@@ -208,15 +299,14 @@ def create_index_if_not_exists(client):
 def generate_clip_id(video_id: str, start_time: float, end_time: float) -> str:
     """Generate deterministic clip_id based on video_id and timestamps"""
     clip_string = f"{video_id}_{start_time:.2f}_{end_time:.2f}"
-    clip_hash = hashlib.sha256(clip_string.encode()).hexdigest()[:16]
+    # 8-byte blake2b digest gives the same 16-hex-char id as truncated SHA-256, faster
+    clip_hash = hashlib.blake2b(clip_string.encode(), digest_size=8).hexdigest()
     return f"clip_{clip_hash}"
 
 
 def parse_s3_uri(s3_uri: str) -> tuple:
     """Parse S3 URI into bucket and key"""
-    s3_parts = s3_uri.replace('s3://', '').split('/', 1)
-    bucket = s3_parts[0]
-    key = s3_parts[1] if len(s3_parts) > 1 else ''
+    bucket, _, key = s3_uri.removeprefix('s3://').partition('/')
     return bucket, key
 
 
@@ -230,7 +320,11 @@ def download_embeddings_from_s3(s3_client, bucket: str, key_prefix: str) -> dict
         try:
             print(f"Trying to read from s3://{bucket}/{key}")
             obj = s3_client.get_object(Bucket=bucket, Key=key)
-            result = json.loads(obj['Body'].read().decode('utf-8'))
+            if orjson:
+                # orjson parses the raw bytes directly, without an intermediate decoded str
+                result = orjson.loads(obj['Body'].read())
+            else:
+                result = json.loads(obj['Body'].read().decode('utf-8'))
             print(f"✓ Successfully read embeddings from S3")
             return result
         except s3_client.exceptions.NoSuchKey:
@@ -250,11 +344,15 @@ def validate_embedding(embedding, expected_dim=EMBEDDING_DIMENSIONS):
     if len(embedding) != expected_dim:
         return False, f"Embedding dimension mismatch: expected {expected_dim}, got {len(embedding)}"
     
-    for i, val in enumerate(embedding):
-        if not isinstance(val, (int, float)):
-            return False, f"Embedding contains non-numeric value at index {i}: {val}"
-        if val != val:  # Check for NaN
-            return False, f"Embedding contains NaN at index {i}"
+    # Convert in C rather than type-checking each element in Python
+    try:
+        values = array('d', embedding)
+    except (TypeError, OverflowError) as e:
+        return False, f"Embedding contains non-numeric value: {e}"
+    
+    if not all(map(math.isfinite, values)):
+        i = next(i for i, val in enumerate(values) if not math.isfinite(val))
+        return False, f"Embedding contains NaN/Inf at index {i}"
     
     return True, "Valid"
 
@@ -270,31 +368,30 @@ def map_embedding_scope_to_field(scope: str) -> Optional[str]:
     return scope_mapping.get(scope, None)
 
 
-def extract_frame_at_timestamp(video_path: str, timestamp: float, temp_dir: str) -> Optional[str]:
-    """Extract a single frame from video at specified timestamp using ffmpeg"""
+def extract_frame_at_timestamp(video_path: str, timestamp: float) -> Optional[bytes]:
+    """Extract a single JPEG frame from video at specified timestamp using ffmpeg"""
     try:
-        frame_output = os.path.join(temp_dir, 'thumbnail_frame.jpg')
-        
-        # Use ffmpeg to extract frame
+        # Use ffmpeg to extract frame, piping the JPEG to stdout
         cmd = [
-            'ffmpeg',
+            FFMPEG_PATH,
             '-ss', str(timestamp),
             '-i', video_path,
-            '-vframes', '1',
+            '-frames:v', '1',
             '-vf', 'scale=640:360',
             '-q:v', '2',
-            '-y',
-            frame_output
+            '-f', 'image2pipe',
+            '-c:v', 'mjpeg',
+            'pipe:1'
         ]
         
         print(f"Extracting frame at {timestamp}s using ffmpeg")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = subprocess.run(cmd, capture_output=True, timeout=30)
         
-        if result.returncode == 0 and os.path.exists(frame_output):
-            print(f"✓ Extracted frame: {frame_output}")
-            return frame_output
+        if result.returncode == 0 and result.stdout:
+            print(f"✓ Extracted frame ({len(result.stdout)} bytes)")
+            return result.stdout
         else:
-            print(f"⚠️ ffmpeg failed: {result.stderr[:200]}")
+            print(f"⚠️ ffmpeg failed: {result.stderr.decode('utf-8', 'replace')[:200]}")
             return None
             
     except FileNotFoundError:
@@ -308,8 +405,33 @@ def extract_frame_at_timestamp(video_path: str, timestamp: float, temp_dir: str)
         return None
 
 
-def upload_frame_to_s3(s3_client, frame_path: str) -> Optional[str]:
-    """Upload extracted frame to S3 and return S3 URI"""
+def extract_frames_at_timestamps(video_path: str, timestamps: List[float]) -> Dict[float, bytes]:
+    """
+    Extract one JPEG frame per timestamp, running a seeking ffmpeg per timestamp concurrently
+    Returns mapping of timestamp to frame bytes; timestamps that yield no frame are omitted
+    """
+    def extract(ts):
+        frame_data = extract_frame_at_timestamp(video_path, ts)
+        if not frame_data and ts > 0:
+            # Fall back for this timestamp only (e.g. a clip start past the last decodable frame)
+            print(f"⚠️ No frame at {ts}s, retrying {FRAME_FALLBACK_SEEK_BACK_SEC}s earlier")
+            frame_data = extract_frame_at_timestamp(video_path, max(ts - FRAME_FALLBACK_SEEK_BACK_SEC, 0.0))
+        return frame_data
+    
+    print(f"Extracting {len(timestamps)} frames with {FRAME_EXTRACT_WORKERS} concurrent ffmpeg runs")
+    with ThreadPoolExecutor(max_workers=FRAME_EXTRACT_WORKERS) as executor:
+        frames = {
+            ts: frame_data
+            for ts, frame_data in zip(timestamps, executor.map(extract, timestamps))
+            if frame_data
+        }
+    
+    print(f"✓ Extracted {len(frames)}/{len(timestamps)} frames")
+    return frames
+
+
+def upload_frame_to_s3(s3_client, frame_data: bytes) -> Optional[str]:
+    """Upload extracted JPEG frame to S3 and return S3 URI"""
     try:
         if not THUMBNAIL_BUCKET:
             print("⚠️ THUMBNAIL_BUCKET not configured, skipping upload")
@@ -319,15 +441,12 @@ def upload_frame_to_s3(s3_client, frame_path: str) -> Optional[str]:
         thumbnail_name = f"{uuid.uuid4()}.jpg"
         thumbnail_key = f"{THUMBNAIL_PREFIX}{thumbnail_name}"
         
-        # Read frame file
-        with open(frame_path, 'rb') as f:
-            frame_data = f.read()
-        
-        # Upload to S3
+        # Upload to S3 with a precomputed checksum so S3 validates the payload
         s3_client.put_object(
             Bucket=THUMBNAIL_BUCKET,
             Key=thumbnail_key,
             Body=frame_data,
+            ContentMD5=base64.b64encode(hashlib.md5(frame_data).digest()).decode('utf-8'),
             ContentType='image/jpeg'
         )
         
@@ -359,24 +478,25 @@ def index_embeddings_to_opensearch_consolidated(opensearch_client, s3_client, em
     video_name = original_video['key'].split('/')[-1].replace('-', ' ').replace('_', ' ')
     video_s3_uri = f"s3://{original_video['bucket']}/{original_video['key']}"
     
-    # Step 1: Group embeddings by clip_id
-    clips_by_id = defaultdict(lambda: {
-        'metadata': None,
-        'embeddings': {}
-    })
-
+    # Step 1: Group embeddings by clip_id (metadata and embeddings kept in parallel dicts)
+    meta_by_id: Dict[str, dict] = {}
+    emb_by_id: Dict[str, Dict[str, list]] = {}
+    clip_ids = {}
     video_duration = 0
-
-    for segment in segments:
-        if video_duration > 0 and segment.get('startSec') == 0:
-            break
-        clip_duration = segment.get('endSec', 0) - segment.get('startSec', 0)
-        video_duration += clip_duration
-
+    in_first_pass = True
     
     for idx, segment in enumerate(segments):
+        g = segment.get
+        
+        # Video duration spans the first run of segments, until startSec resets to 0 for the next modality
+        if in_first_pass:
+            if video_duration > 0 and g('startSec') == 0:
+                in_first_pass = False
+            else:
+                video_duration += g('endSec', 0) - g('startSec', 0)
+        
         try:
-            embedding = segment.get('embedding', [])
+            embedding = g('embedding', [])
             
             # Validate embedding
             is_valid, validation_msg = validate_embedding(embedding)
@@ -384,20 +504,23 @@ def index_embeddings_to_opensearch_consolidated(opensearch_client, s3_client, em
                 print(f"⚠️ Skipping segment {idx}: {validation_msg}")
                 continue
             
-            start_time = round(segment.get('startSec', 0), 2)
-            end_time = round(segment.get('endSec', 0), 2)
-            embedding_scope = segment.get('embeddingOption', 'unknown')
+            start_time = round(g('startSec', 0), 2)
+            end_time = round(g('endSec', 0), 2)
+            embedding_scope = g('embeddingOption', 'unknown')
             
-            # Generate clip ID
-            clip_id = generate_clip_id(video_id, start_time, end_time)
+            # Generate clip ID (hashed once per clip, shared by all its modalities)
+            clip_id = clip_ids.get((start_time, end_time))
+            if clip_id is None:
+                clip_id = generate_clip_id(video_id, start_time, end_time)
+                clip_ids[(start_time, end_time)] = clip_id
             
             # Store metadata (once per clip)
-            if clips_by_id[clip_id]['metadata'] is None:
-                clips_by_id[clip_id]['metadata'] = {
+            if clip_id not in meta_by_id:
+                meta_by_id[clip_id] = {
                     'video_id': video_id,
                     'video_path': video_s3_uri,
                     'video_name': video_name,
-                    'video_duration_sec': round(video_duration, 2),
+                    'video_duration_sec': None,  # Filled in once all segments are seen
                     'clip_id': clip_id,
                     'part': part,
                     'timestamp_start': float(start_time),
@@ -411,7 +534,7 @@ def index_embeddings_to_opensearch_consolidated(opensearch_client, s3_client, em
             # Map scope to field name and store embedding
             field_name = map_embedding_scope_to_field(embedding_scope)
             if field_name:
-                clips_by_id[clip_id]['embeddings'][field_name] = embedding
+                emb_by_id.setdefault(clip_id, {})[field_name] = embedding
                 print(f"  Clip {clip_id[:8]}... - Added {embedding_scope} → {field_name}")
             else:
                 print(f"⚠️ Unknown embedding scope: {embedding_scope}")
@@ -420,7 +543,11 @@ def index_embeddings_to_opensearch_consolidated(opensearch_client, s3_client, em
             print(f"Error processing segment {idx}: {e}")
             continue
     
-    print(f"✓ Consolidated {len(segments)} segments into {len(clips_by_id)} unique clips")
+    video_duration = round(video_duration, 2)
+    for metadata in meta_by_id.values():
+        metadata['video_duration_sec'] = video_duration
+    
+    print(f"✓ Consolidated {len(segments)} segments into {len(meta_by_id)} unique clips")
     
     # ===== Download video ONCE before processing clips =====
     temp_dir = tempfile.mkdtemp()
@@ -432,34 +559,58 @@ def index_embeddings_to_opensearch_consolidated(opensearch_client, s3_client, em
         
         try:
             print(f"Downloading video from s3://{original_video['bucket']}/{original_video['key']}")
-            s3_client.download_file(original_video['bucket'], original_video['key'], video_path)
-            print(f"✓ Downloaded video to {video_path} (will reuse for all {len(clips_by_id)} clips)")
+            s3_client.download_file(
+                original_video['bucket'],
+                original_video['key'],
+                video_path,
+                Config=VIDEO_TRANSFER_CONFIG
+            )
+            print(f"✓ Downloaded video to {video_path} (will reuse for all {len(meta_by_id)} clips)")
         except Exception as e:
             print(f"⚠️ Cannot download video: {str(e)[:100]}")
             print(f"  Skipping thumbnail generation for all clips")
             video_path = None
         
-        # Step 2: Index consolidated clips with thumbnails
-        indexed_count = 0
+        # Step 2: Generate thumbnails for all clips up front
+        # Clips starting within the same 100 ms bucket share one thumbnail
+        thumbnail_cache: Dict[float, Optional[str]] = {}
+        
+        if video_path and os.path.exists(video_path):
+            bucket_timestamps: Dict[float, float] = {}
+            for ts in sorted({
+                meta_by_id[clip_id]['timestamp_start']
+                for clip_id in emb_by_id
+            }):
+                bucket_timestamps.setdefault(round(ts, 1), ts)
+            
+            thumbnails = generate_thumbnails_from_downloaded_video(
+                s3_client,
+                video_path,
+                list(bucket_timestamps.values())
+            )
+            thumbnail_cache = {
+                bucket: thumbnails.get(ts)
+                for bucket, ts in bucket_timestamps.items()
+            }
         
-        for clip_id, clip_data in clips_by_id.items():
+        # Step 3: Build consolidated documents with thumbnails
+        actions = []
+        
+        for clip_id, doc in meta_by_id.items():
             try:
-                # Build document
-                doc = clip_data['metadata'].copy()
-                doc.update(clip_data['embeddings'])
+                embeddings = emb_by_id.get(clip_id, {})
                 
                 # Skip if no embeddings
-                if len(clip_data['embeddings']) == 0:
+                if len(embeddings) == 0:
                     print(f"⚠️ Skipping clip {clip_id} - no valid embeddings")
                     continue
                 
-                # Generate thumbnail using the already-downloaded video
+                # Build document in place (metadata is not reused after this)
+                doc.update(embeddings)
+                
+                # Attach thumbnail generated from the already-downloaded video
                 if video_path and os.path.exists(video_path):
-                    thumbnail_uri = generate_thumbnail_from_downloaded_video(
-                        s3_client,
-                        video_path,
-                        doc['timestamp_start']
-                    )
+                    thumbnail_uri = thumbnail_cache.get(round(doc['timestamp_start'], 1))
                     
                     if thumbnail_uri:
                         doc['thumbnail_path'] = thumbnail_uri
@@ -471,30 +622,49 @@ def index_embeddings_to_opensearch_consolidated(opensearch_client, s3_client, em
                     doc['thumbnail_path'] = None
                     print(f"  ⚠️ Video not available, skipping thumbnail")
                 
-                # Index document
-                response = opensearch_client.index(
-                    index=index_name,
-                    id=clip_id,
-                    body=doc
-                )
-                
-                indexed_count += 1
-                
-                if indexed_count % 10 == 0:
-                    print(f"Indexed {indexed_count}/{len(clips_by_id)} consolidated clips")
+                # Index and op_type ('index') come from the bulk call itself
+                actions.append({'_id': clip_id, '_source': doc})
                 
                 # Log details
-                modalities = list(clip_data['embeddings'].keys())
+                modalities = list(embeddings.keys())
                 duration = doc['clip_duration']
-                print(f"  ✓ Clip {clip_id[:8]}... indexed:")
+                print(f"  ✓ Clip {clip_id[:8]}... prepared:")
                 print(f"     Duration: {duration:.2f}s")
                 print(f"     Modalities ({len(modalities)}): {modalities}")
                 
             except Exception as e:
-                print(f"Error indexing clip {clip_id}: {e}")
+                print(f"Error preparing clip {clip_id}: {e}")
                 continue
         
-        print(f"✓ Successfully indexed {indexed_count} consolidated clips with thumbnails")
+        # Step 4: Index all documents in bulk (one round-trip per chunk instead of per clip)
+        indexed_count = 0
+        
+        if actions:
+            # Split small batches across all threads instead of sending one full chunk
+            chunk_size = min(BULK_CHUNK_SIZE, math.ceil(len(actions) / BULK_THREAD_COUNT))
+            chunks = [actions[i:i + chunk_size] for i in range(0, len(actions), chunk_size)]
+            
+            # helpers.parallel_bulk needs multiprocessing semaphores, which Lambda lacks (no /dev/shm)
+            def bulk_index_chunk(chunk):
+                return helpers.bulk(
+                    opensearch_client,
+                    chunk,
+                    chunk_size=BULK_CHUNK_SIZE,
+                    max_chunk_bytes=BULK_MAX_CHUNK_BYTES,
+                    index=index_name,
+                    request_timeout=60,
+                    raise_on_error=False,
+                    stats_only=False
+                )
+            
+            print(f"Bulk indexing {len(actions)} consolidated clips in {len(chunks)} chunk(s) with {BULK_THREAD_COUNT} threads")
+            with ThreadPoolExecutor(max_workers=BULK_THREAD_COUNT) as executor:
+                for success_count, errors in executor.map(bulk_index_chunk, chunks):
+                    indexed_count += success_count
+                    for error in errors:
+                        print(f"Error indexing clip: {error}")
+        
+        print(f"✓ Successfully indexed {indexed_count}/{len(actions)} consolidated clips with thumbnails")
         
         return indexed_count
         
@@ -505,35 +675,24 @@ def index_embeddings_to_opensearch_consolidated(opensearch_client, s3_client, em
             print(f"✓ Cleaned up temporary directory")
 
 
-def generate_thumbnail_from_downloaded_video(s3_client, video_path: str, timestamp: float) -> Optional[str]:
+def generate_thumbnails_from_downloaded_video(s3_client, video_path: str, timestamps: List[float]) -> Dict[float, Optional[str]]:
     """
-    Generate thumbnail from already-downloaded video at specified timestamp
-    Returns S3 URI of generated thumbnail
+    Generate thumbnails for all timestamps from already-downloaded video
+    Extracts frames concurrently and uploads them to S3 concurrently
+    Returns mapping of timestamp to S3 URI of generated thumbnail (missing if no frame was extracted)
     """
-    try:
-        print(f"Generating thumbnail at {timestamp}s from {video_path}")
-        
-        # Create temporary directory for frame
-        temp_dir = tempfile.mkdtemp()
-        
-        try:
-            # Extract frame at timestamp
-            frame_path = extract_frame_at_timestamp(video_path, timestamp, temp_dir)
-            
-            if frame_path:
-                # Upload frame to S3
-                thumbnail_s3_uri = upload_frame_to_s3(s3_client, frame_path)
-                print(f"✓ Generated thumbnail: {thumbnail_s3_uri}")
-                return thumbnail_s3_uri
-            else:
-                print(f"⚠️ Frame extraction failed")
-                return None
-                
-        finally:
-            # Cleanup frame temp directory
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
-        
-    except Exception as e:
-        print(f"✗ Error generating thumbnail: {e}")
-        return None
+    if not timestamps:
+        return {}
+    
+    frames = extract_frames_at_timestamps(video_path, timestamps)
+    
+    with ThreadPoolExecutor(max_workers=THUMBNAIL_UPLOAD_WORKERS) as executor:
+        thumbnail_uris = executor.map(
+            lambda frame_data: upload_frame_to_s3(s3_client, frame_data),
+            frames.values()
+        )
+        thumbnails = dict(zip(frames.keys(), thumbnail_uris))
+    
+    print(f"✓ Uploaded {sum(1 for uri in thumbnails.values() if uri)}/{len(timestamps)} thumbnails")
+    return thumbnails
+
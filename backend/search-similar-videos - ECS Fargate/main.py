@@ -9,7 +9,10 @@ import uuid
 import datetime
 import asyncio
 import math
+import orjson
 from opensearchpy import OpenSearch, RequestsHttpConnection, AWSV4SignerAuth
+from opensearchpy.exceptions import SerializationError
+from opensearchpy.serializer import JSONSerializer
 from typing import List, Dict, Optional, Any
 from pydantic import BaseModel
 import uvicorn
@@ -57,7 +60,8 @@ AUTH_DEV_USERNAME = (os.environ.get("AUTH_DEV_USERNAME") or "").strip()
 AUTH_DEV_PASSWORD = (os.environ.get("AUTH_DEV_PASSWORD") or "").strip()
 AUTH_DEV_EMAIL = (os.environ.get("AUTH_DEV_EMAIL") or "").strip()
 _bearer = HTTPBearer(auto_error=False)
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt_sha256 for seeded users; plain bcrypt kept so existing hashes still verify
+_pwd_context = CryptContext(schemes=["bcrypt_sha256", "bcrypt"], deprecated="auto")
 _docdb_client: Optional[MongoClient] = None
 _docdb_client_uri: Optional[str] = None
 
@@ -970,6 +974,25 @@ async def complete_multipart_upload(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+class ORJSONSerializer(JSONSerializer):
+    """OpenSearch serializer backed by orjson (query vectors, search responses)."""
+
+    def dumps(self, data):
+        # don't serialize strings (pre-built bodies)
+        if isinstance(data, str):
+            return data
+        try:
+            return orjson.dumps(data, default=self.default).decode("utf-8")
+        except TypeError as e:
+            raise SerializationError(data, e)
+
+    def loads(self, s):
+        try:
+            return orjson.loads(s)
+        except ValueError as e:
+            raise SerializationError(s, e)
+
+
 def get_opensearch_client():
     """Initialize OpenSearch Cluster client"""
     opensearch_host = os.environ.get("OPENSEARCH_CLUSTER_HOST")
@@ -992,6 +1015,7 @@ def get_opensearch_client():
         verify_certs=True,
         connection_class=RequestsHttpConnection,
         pool_maxsize=20,
+        serializer=ORJSONSerializer(),
     )
 
 